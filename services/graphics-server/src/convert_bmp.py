@@ -1,20 +1,34 @@
 #!/usr/bin/python3
 
 import argparse
+import struct
+
+# one bitmap row: 11 32-bit words (44 bytes). Bit-reversing a big-endian word is the same as
+# bit-reversing each byte and reading the word little-endian, so rows are decoded as '<' after
+# the image has been passed through REV8.
+ROW = struct.Struct('<11I')
+ROW_FORMAT = "0x{:08x}, " * 11
+
+# bit-reversed value of every byte, for use with bytes.translate()
+REV8 = bytes(int('{:08b}'.format(b)[::-1], 2) for b in range(256))
 
 def bitflip(data_block, bitwidth=32):
     if bitwidth == 0:
         return data_block
 
+    # reversing a word's bits is reversing each byte's bits (REV8) and then the byte order
+    flipped = data_block.translate(REV8)
+    if bitwidth == 8:
+        return bytes(flipped)
+
     bytewidth = bitwidth // 8
-    bitswapped = bytearray()
+    # a trailing partial word still produces a full word of output, zero-filled at the end
+    words = (len(data_block) + bytewidth - 1) // bytewidth
+    bitswapped = bytearray(words * bytewidth)
 
-    i = 0
-    while i < len(data_block):
-        data = int.from_bytes(data_block[i:i+bytewidth], byteorder='big', signed=False)
-        b = '{:0{width}b}'.format(data, width=bitwidth)
-        bitswapped.extend(int(b[::-1], 2).to_bytes(bytewidth, byteorder='big'))
-        i = i + bytewidth
+    for i in range(0, len(flipped), bytewidth):
+        word = flipped[i:i+bytewidth]
+        bitswapped[i:i+len(word)] = word[::-1]
 
     return bytes(bitswapped)
 
@@ -29,24 +43,24 @@ def convert(ifile, ofile):
         if ((length - 64) % 44) != 0:
             print("warning: file length is not an integer multiple of rows. output will be malformed. length: {}, rows: {}".format(length, rows))
 
+        flipped = image.translate(REV8)
+
+        # accumulate the whole file and write it once, rather than thousands of tiny writes
+        parts = ["pub const LOGO_MAP: [u32; 11 * {}] = [\n".format(rows)]
+
+        line = rows
+        while line > 0:
+            words = [word ^ 0xFFFFFFFF for word in ROW.unpack_from(flipped, offset + (line-1) * 44)]
+            # only the low 16 bits of the last word are on-screen; the rest read back as inverted zeros
+            words[10] |= 0xFFFF0000
+            parts.append(ROW_FORMAT.format(*words))
+            line = line - 1
+            parts.append("\n")
+
+        parts.append("];")
+
         with open(ofile, "w") as output:
-            output.write("pub const LOGO_MAP: [u32; 11 * {}] = [\n".format(rows))
-
-            line = rows
-            while line > 0:
-                horiz = 0
-                while horiz < 11:
-                    position = offset + (line-1) * 44 + horiz * 4
-                    word = int.from_bytes(image[position:position + 4], byteorder='big')
-                    word = int('{:032b}'.format(word)[::-1],2)
-                    if horiz == 10:
-                        word = (word & 0x0000FFFF);
-                    output.write("0x{:08x}, ".format(word ^ 0xFFFFFFFF));
-                    horiz = horiz + 1
-                line = line - 1
-                output.write("\n")
-
-            output.write("];");
+            output.write("".join(parts))
 
 
 def main():
@@ -16,7 +16,7 @@ SIGNER_VERSION=1
 def blob_sign(source, output, key, defile=False):
     global SIGNER_VERSION
     with open(source, "rb") as source_f:
-        source = list(source_f.read())
+        source = source_f.read() # keep this as bytes; a list of ints costs ~8x the memory of the image
         source += int(SIGNER_VERSION).to_bytes(4, 'little') # protect the version number
         source += len(source).to_bytes(4, 'little') # append the length to the image, and sign that
 
@@ -31,10 +31,11 @@ def blob_sign(source, output, key, defile=False):
             written += output_f.write(int(SIGNER_VERSION).to_bytes(4, 'little')) # version number record - mirrored inside the signed data, too
             written += output_f.write(len(source).to_bytes(4, 'little')) # record the length of the final signed record (which /also/ includes a length)
             written += output_f.write(signature.signature)
-            output_f.write(bytearray([0] * (4096 - written))) # pad out to one page beyond
-            message = bytearray(signature.message)
+            output_f.write(bytes(4096 - written)) # pad out to one page beyond
+            message = signature.message
             if defile is True:
                 print("WARNING: defiling the image. This corrupts the binary and should cause it to fail the signature check.")
+                message = bytearray(message)
                 message[16778] ^= 0x1 # flip one bit at some random offset
             output_f.write(message) # the actual signed message
 
@@ -133,7 +133,7 @@ class PrecursorUsb:
             if numread != bufsize:
                 sys.stderr.write("Burst read error: {} bytes requested, {} bytes read at 0x{:08x}\n".format(bufsize, numread, cur_addr))
             else:
-                ret = ret + data
+                ret.extend(data)
 
         return ret
 
@@ -174,7 +174,7 @@ class PrecursorUsb:
 
         csr_data = self.burst_read(LOC_CSRCSV, 0x8000)
         hasher = hashlib.sha512()
-        hasher.update(csr_data[:0x7FC0])
+        hasher.update(memoryview(csr_data)[:0x7FC0]) # hash in place, no copy of the descriptor
         digest = hasher.digest()
         if digest != csr_data[0x7fc0:]:
             sys.stderr.write("Could not find a valid csr.csv descriptor on the device, aborting!\n")
@@ -100,7 +100,7 @@ class PrecursorUsb:
                 print("Burst read error: {} bytes requested, {} bytes read at 0x{:08x}".format(bufsize, numread, cur_addr))
                 exit(1)
 
-            ret = ret + data
+            ret.extend(data)
 
         return ret
 
@@ -201,7 +201,7 @@ class PrecursorUsb:
 
         csr_data = self.burst_read(LOC_CSRCSV, 0x8000)
         hasher = hashlib.sha512()
-        hasher.update(csr_data[:0x7FC0])
+        hasher.update(memoryview(csr_data)[:0x7FC0]) # hash in place, no copy of the descriptor
         digest = hasher.digest()
         if digest != csr_data[0x7fc0:]:
             print("Could not find a valid csr.csv descriptor on the device, aborting!")
@@ -289,7 +289,7 @@ class PrecursorUsb:
         # program
         # pad out to the nearest word length
         if len(data) % 4 != 0:
-            data += bytearray([0xff] * (4 - (len(data) % 4)))
+            data += b"\xff" * (4 - (len(data) % 4))
         written = 0
         progress = ProgressBar(min_value=0, max_value=len(data), prefix='Writing ').start()
         while written < len(data):